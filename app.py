@@ -1,11 +1,42 @@
 from __future__ import annotations
 
-from flask import Flask, jsonify, request
+try:
+    from gevent import monkey
+
+    monkey.patch_all()
+except ImportError:  # pragma: no cover - gevent optional
+    monkey = None
+
+import atexit
+import hashlib
+import threading
+from typing import Optional
+
+from cachetools import TTLCache
+import orjson
+from flask import Flask, Response, jsonify, request, stream_with_context
 
 from news_agent import AgentConfig, NewsAgent
 
 app = Flask(__name__)
 _agent = NewsAgent(AgentConfig.from_env())
+atexit.register(_agent.close)
+_response_cache: Optional[TTLCache] = (
+    TTLCache(maxsize=1024, ttl=_agent.config.cache_ttl) if _agent.config.cache_ttl > 0 else None
+)
+_response_cache_lock = threading.Lock()
+NDJSON_MIMETYPE = "application/x-ndjson"
+
+
+def _response_cache_key(query: str, limit: object) -> str:
+    return hashlib.blake2b(f"{query}|{limit}".encode(), digest_size=16).hexdigest()
+
+
+def _json_bytes(payload: object) -> bytes:
+    # Sorted keys and a trailing newline, like jsonify; non-ASCII text is emitted as raw
+    # UTF-8 rather than \u escapes. No ``default=``: to_dict only returns JSON primitives,
+    # so anything else is a bug that should fail loudly.
+    return orjson.dumps(payload, option=orjson.OPT_SORT_KEYS | orjson.OPT_APPEND_NEWLINE)
 
 
 @app.get("/health")
@@ -13,6 +44,17 @@ def healthcheck():
     return {"status": "ok"}
 
 
+def _ndjson(first, items):
+    try:
+        yield _json_bytes(_agent.to_dict(first))
+        for item in items:
+            yield _json_bytes(_agent.to_dict(item))
+    except Exception:  # pragma: no cover - runtime guard
+        # Headers are already sent, so the failure is reported as a final error line.
+        app.logger.exception("Uncaught exception while streaming /news")
+        yield _json_bytes({"error": "Unexpected server error"})
+
+
 @app.post("/news")
 def fetch_news():
     payload = request.get_json(silent=True) or {}
@@ -20,9 +62,33 @@ def fetch_news():
     limit = payload.get("limit")
     if not query:
         return jsonify({"error": "`query` is required"}), 400
+    if request.accept_mimetypes.best_match(["application/json", NDJSON_MIMETYPE]) == NDJSON_MIMETYPE:
+        try:
+            items = _agent.search_iter(query=query, limit=limit)
+            # Pull the first item before headers go out, so early failures still get a
+            # proper status code and an empty result is an empty 200 body.
+            first = next(items, None)
+        except ValueError as exc:
+            return jsonify({"error": str(exc)}), 400
+        except Exception as exc:  # pragma: no cover - runtime guard
+            app.logger.exception("Uncaught exception when handling /news")
+            return jsonify({"error": "Unexpected server error", "detail": str(exc)}), 500
+        if first is None:
+            return Response(b"", mimetype=NDJSON_MIMETYPE)
+        return Response(stream_with_context(_ndjson(first, items)), mimetype=NDJSON_MIMETYPE)
+    key = _response_cache_key(query, limit)
+    if _response_cache is not None:
+        with _response_cache_lock:
+            body = _response_cache.get(key)
+        if body is not None:
+            return Response(body, mimetype="application/json")
     try:
         items = _agent.search(query=query, limit=limit)
-        return jsonify([_agent.to_dict(item) for item in items])
+        body = _json_bytes([_agent.to_dict(item) for item in items])
+        if _response_cache is not None:
+            with _response_cache_lock:
+                _response_cache[key] = body
+        return Response(body, mimetype="application/json")
     except ValueError as exc:
         return jsonify({"error": str(exc)}), 400
     except Exception as exc:  # pragma: no cover - runtime guard
@@ -31,4 +97,9 @@ def fetch_news():
 
 
 if __name__ == "__main__":
-    app.run(debug=True, host="0.0.0.0", port=8008)
+    if monkey is not None:
+        from gevent.pywsgi import WSGIServer
+
+        WSGIServer(("0.0.0.0", 8008), app).serve_forever()
+    else:
+        app.run(debug=True, host="0.0.0.0", port=8008, threaded=True)
@@ -1,23 +1,36 @@
 from __future__ import annotations
 
-from dataclasses import asdict
-import re
-from typing import Iterable, List, Optional
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+import logging
+import string
+import threading
+from typing import Iterable, Iterator, List, Optional
 from urllib.parse import urlparse
 
+from .analysis import analyze_batch
+from .cache import ContentCache, SemanticQueryCache
 from .config import AgentConfig
 from .models import NewsItem, RawArticle
 from .providers.base import BaseProvider, ProviderList
 from .providers.wired_rss_provider import WiredRSSProvider
 from .providers.sec_provider import SECFilingsProvider
-from .sentiment import score_sentiment
-from .summarizer import summarize
 
 try:
     from .providers.newsapi_provider import NewsAPIProvider
 except Exception:  # pragma: no cover - dependency optional
     NewsAPIProvider = None  # type: ignore
 
+logger = logging.getLogger(__name__)
+
+# Summary and sentiment per article text, shared across requests since both are pure functions of the text.
+_ANALYSIS_CACHE: ContentCache[tuple[Optional[str], tuple[str, float]]] = ContentCache(maxsize=4096)
+
+# Every ASCII byte except lowercase letters and digits; deleted when building dedupe keys.
+_NON_ALNUM_BYTES = bytes(
+    code for code in range(128) if chr(code) not in string.ascii_lowercase + string.digits
+)
+
 
 class NewsAgent:
     """Aggregates, summarizes, and scores news articles."""
@@ -30,6 +43,23 @@ class NewsAgent:
             self.providers = self._build_providers()
         if not self.providers:
             raise RuntimeError("No providers configured for NewsAgent")
+        self._cache: Optional[SemanticQueryCache] = None
+        if self.config.cache_ttl > 0:
+            self._cache = SemanticQueryCache(
+                ttl=self.config.cache_ttl,
+                threshold=self.config.semantic_cache_threshold,
+            )
+        self._nlp_pool: Optional[ProcessPoolExecutor] = None
+        self._nlp_pool_lock = threading.Lock()
+        if self.config.nlp_workers > 0:
+            self._nlp_pool = ProcessPoolExecutor(max_workers=self.config.nlp_workers)
+
+    def close(self) -> None:
+        """Shut down the NLP worker processes, if any; the agent still works in-process afterwards."""
+        with self._nlp_pool_lock:
+            pool, self._nlp_pool = self._nlp_pool, None
+        if pool is not None:
+            pool.shutdown(wait=True, cancel_futures=True)
 
     def _build_providers(self) -> ProviderList:
         providers: ProviderList = []
@@ -37,48 +67,136 @@ class NewsAgent:
             providers.append(NewsAPIProvider(self.config.newsapi_key))
         if getattr(self.config, "sec_user_agent", None):
             try:
-                providers.append(SECFilingsProvider(self.config.sec_user_agent))
+                providers.append(
+                    SECFilingsProvider(self.config.sec_user_agent, cache_dir=self.config.sec_cache_dir)
+                )
             except ValueError as exc:
                 raise RuntimeError(f"SEC provider misconfigured: {exc}") from exc
         providers.append(WiredRSSProvider())
         return providers
 
     def search(self, query: str, limit: Optional[int] = None, **kwargs) -> List[NewsItem]:
+        return list(self.search_iter(query, limit, **kwargs))
+
+    def search_iter(self, query: str, limit: Optional[int] = None, **kwargs) -> Iterator[NewsItem]:
+        """Yield processed items as each provider finishes instead of after the slowest one.
+
+        The query and limit are validated eagerly so callers get ``ValueError`` before iterating.
+        """
         if not query or not query.strip():
             raise ValueError("Query must be provided")
-        limit = limit or self.config.default_limit
+        return self._iter_results(query, _coerce_limit(limit, self.config.default_limit), kwargs)
+
+    def _iter_results(self, query: str, limit: int, kwargs: dict) -> Iterator[NewsItem]:
+        # Provider kwargs change what comes back, so only plain queries are cached.
+        use_cache = self._cache is not None and not kwargs
+        if use_cache:
+            vector = self._cache.embed(query)
+            cached = self._cache.get(query, limit, vector)
+            if cached is not None:
+                yield from cached
+                return
+        results: List[NewsItem] = []
+        for batch in self._iter_article_batches(query, limit, kwargs):
+            items = self._process_batch(batch)
+            results.extend(items)
+            yield from items
+        if use_cache:
+            self._cache.put(query, limit, results, vector)
+
+    def _iter_article_batches(self, query: str, limit: int, kwargs: dict) -> Iterator[List[RawArticle]]:
+        """Yield the newly accepted articles from each provider in completion order."""
         seen_urls: set[str] = set()
         seen_titles: set[str] = set()
         seen_sources: dict[str, int] = {}
-        results: List[NewsItem] = []
-        for provider in self.providers:
-            for raw in provider.fetch(query=query, limit=limit, **kwargs):
-                if raw.url:
-                    if raw.url in seen_urls:
+        accepted = 0
+        executor = ThreadPoolExecutor(max_workers=len(self.providers))
+        futures = [
+            executor.submit(self._fetch_provider, provider, query, limit, kwargs)
+            for provider in self.providers
+        ]
+        try:
+            for future in as_completed(futures):
+                batch: List[RawArticle] = []
+                for raw in future.result():
+                    if raw.url:
+                        if raw.url in seen_urls:
+                            continue
+                        if not self._is_allowed_domain(raw.url):
+                            continue
+                        seen_urls.add(raw.url)
+                    dedupe_key = self._dedupe_key(raw)
+                    if dedupe_key and dedupe_key in seen_titles:
                         continue
-                    if not self._is_allowed_domain(raw.url):
+                    source_key = self._source_key(raw)
+                    if source_key and self._exceeds_source_limit(source_key, seen_sources):
                         continue
-                    seen_urls.add(raw.url)
-                dedupe_key = self._dedupe_key(raw)
-                if dedupe_key and dedupe_key in seen_titles:
-                    continue
-                source_key = self._source_key(raw)
-                if source_key and self._exceeds_source_limit(source_key, seen_sources):
-                    continue
-                item = self._process(raw)
-                results.append(item)
-                if dedupe_key:
-                    seen_titles.add(dedupe_key)
-                if source_key:
-                    seen_sources[source_key] = seen_sources.get(source_key, 0) + 1
-                if len(results) >= limit:
-                    return results
-        return results
-
-    def _process(self, article: RawArticle) -> NewsItem:
-        text = article.content or article.description
-        summary = summarize(text)
-        sentiment_label, sentiment_score = score_sentiment(text or "")
+                    batch.append(raw)
+                    accepted += 1
+                    if dedupe_key:
+                        seen_titles.add(dedupe_key)
+                    if source_key:
+                        seen_sources[source_key] = seen_sources.get(source_key, 0) + 1
+                    if accepted >= limit:
+                        break
+                if batch:
+                    yield batch
+                if accepted >= limit:
+                    return
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    @staticmethod
+    def _fetch_provider(provider: BaseProvider, query: str, limit: int, kwargs: dict) -> List[RawArticle]:
+        # Materialize inside the worker so generator-based providers do their I/O off the caller thread.
+        return list(provider.fetch(query=query, limit=limit, **kwargs))
+
+    def _process_batch(self, articles: List[RawArticle]) -> List[NewsItem]:
+        texts = [article.content or article.description for article in articles]
+        return [
+            self._build_item(article, summary, sentiment)
+            for article, (summary, sentiment) in zip(articles, self._analyze_batch(texts))
+        ]
+
+    def _analyze_batch(self, texts: List[Optional[str]]) -> List[tuple[Optional[str], tuple[str, float]]]:
+        analyses = [_ANALYSIS_CACHE.get(text) for text in texts]
+        missing = [idx for idx, analysis in enumerate(analyses) if analysis is None]
+        if missing:
+            pending = [texts[idx] for idx in missing]
+            for idx, analysis in zip(missing, self._run_analysis(pending)):
+                analyses[idx] = analysis
+                _ANALYSIS_CACHE.put(texts[idx], analysis)
+        return analyses
+
+    def _run_analysis(self, texts: List[Optional[str]]) -> List[tuple[Optional[str], tuple[str, float]]]:
+        pool = self._nlp_pool
+        if pool is None:
+            return analyze_batch(texts)
+        # Spread the batch over the worker processes so NLP runs outside this process's GIL.
+        workers = self.config.nlp_workers
+        chunk = -(-len(texts) // workers)
+        try:
+            futures = [
+                pool.submit(analyze_batch, texts[start:start + chunk])
+                for start in range(0, len(texts), chunk)
+            ]
+            return [analysis for future in futures for analysis in future.result()]
+        except BrokenProcessPool:
+            # A worker died (OOM killer, signal); analyze this batch here and start a fresh pool.
+            logger.warning("NLP worker pool broke; restarting it and analyzing in-process")
+            self._replace_nlp_pool(pool)
+            return analyze_batch(texts)
+
+    def _replace_nlp_pool(self, broken: ProcessPoolExecutor) -> None:
+        with self._nlp_pool_lock:
+            # Concurrent requests may all see the same broken pool; only the first replaces it.
+            if self._nlp_pool is not broken:
+                return
+            self._nlp_pool = ProcessPoolExecutor(max_workers=self.config.nlp_workers)
+        broken.shutdown(wait=False, cancel_futures=True)
+
+    def _build_item(self, article: RawArticle, summary: Optional[str], sentiment: tuple[str, float]) -> NewsItem:
+        sentiment_label, sentiment_score = sentiment
         excerpt = (article.description or article.content)
         if excerpt and len(excerpt) > 280:
             excerpt = excerpt[:277].rstrip() + "..."
@@ -100,27 +218,30 @@ class NewsAgent:
         if not parsed.netloc:
             return True
         hostname = parsed.netloc.lower()
-        for domain in self.config.allowed_domains:
-            domain = domain.lower()
-            if hostname == domain or hostname.endswith(f".{domain}"):
-                return True
-        return False
+        return hostname in self.config.allowed_hosts or hostname.endswith(self.config.allowed_suffixes)
 
     def to_dict(self, item: NewsItem) -> dict:
-        data = asdict(item)
-        if item.published_at is not None:
-            data["published_at"] = item.published_at.isoformat()
-        return data
+        # Built field by field: ``asdict`` deep-copies recursively and is the slow path for slotted dataclasses.
+        return {
+            "title": item.title,
+            "url": item.url,
+            "source": item.source,
+            "published_at": item.published_at.isoformat() if item.published_at is not None else None,
+            "summary": item.summary,
+            "sentiment": item.sentiment,
+            "sentiment_score": item.sentiment_score,
+            "excerpt": item.excerpt,
+        }
 
     def _dedupe_key(self, article: RawArticle) -> Optional[str]:
         title = (article.title or "").strip().lower()
         if title:
-            normalized_title = re.sub(r"[^a-z0-9]+", "", title)
+            normalized_title = _strip_non_alnum(title)
             if normalized_title:
                 return normalized_title
         excerpt = (article.description or article.content or "").strip().lower()
         if excerpt:
-            normalized_excerpt = re.sub(r"[^a-z0-9]+", "", excerpt[:120])
+            normalized_excerpt = _strip_non_alnum(excerpt[:120])
             if normalized_excerpt:
                 return normalized_excerpt
         return None
@@ -128,7 +249,7 @@ class NewsAgent:
     def _source_key(self, article: RawArticle) -> Optional[str]:
         source = (article.source or "").strip().lower()
         if source:
-            normalized = re.sub(r"[^a-z0-9]+", "", source)
+            normalized = _strip_non_alnum(source)
             if normalized:
                 return normalized
         if article.url:
@@ -141,3 +262,23 @@ class NewsAgent:
         if self.config.max_per_source is None:
             return False
         return seen_sources.get(source_key, 0) >= self.config.max_per_source
+
+
+def _coerce_limit(limit: object, default: int) -> int:
+    """Accept an int or an integer string (JSON clients send both); falsy means the default."""
+    if not limit:
+        return default
+    if isinstance(limit, bool):
+        raise ValueError("Limit must be a positive integer")
+    try:
+        value = int(limit.strip() if isinstance(limit, str) else limit)
+    except (TypeError, ValueError):
+        raise ValueError("Limit must be a positive integer") from None
+    if value <= 0 or (isinstance(limit, float) and value != limit):
+        raise ValueError("Limit must be a positive integer")
+    return value
+
+
+def _strip_non_alnum(value: str) -> str:
+    """Keep only ``[a-z0-9]`` characters of an already-lowercased string."""
+    return value.encode("ascii", "ignore").translate(None, _NON_ALNUM_BYTES).decode("ascii")
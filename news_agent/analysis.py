@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+from typing import List, Optional, Sequence
+
+from .sentiment import score_sentiment
+from .summarizer import summarize
+
+Analysis = tuple[Optional[str], tuple[str, float]]
+
+
+def analyze(text: Optional[str], max_sentences: int = 2) -> Analysis:
+    """Return ``(summary, (sentiment_label, sentiment_score))`` for one text.
+
+    The two passes run independently: lowercasing is a small fraction of either, so
+    sharing one lowercase copy between them costs more bookkeeping than it saves.
+    """
+    return summarize(text, max_sentences), score_sentiment(text)
+
+
+def analyze_batch(texts: Sequence[Optional[str]], max_sentences: int = 2) -> List[Analysis]:
+    """Analyze many texts in one call; NewsAgent and its NLP worker pool go through here."""
+    return [analyze(text, max_sentences=max_sentences) for text in texts]
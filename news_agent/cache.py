@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+from collections import Counter, OrderedDict
+from dataclasses import dataclass
+import hashlib
+import math
+import re
+import threading
+import time
+from typing import Callable, Generic, List, Mapping, Optional, Sequence, TypeVar, Union
+
+from cachetools import LRUCache
+
+from .models import NewsItem
+
+try:
+    from sentence_transformers import SentenceTransformer
+except Exception:  # pragma: no cover - dependency optional
+    SentenceTransformer = None  # type: ignore
+
+# Words in any script plus runs of symbols, so "C++" and "C#" stay distinct tokens.
+_QUERY_TOKEN_RE = re.compile(r"\w+|[^\w\s]+")
+
+Vector = Union[Sequence[float], Mapping[str, float]]
+T = TypeVar("T")
+
+
+@dataclass(slots=True)
+class _CacheEntry:
+    vector: Vector
+    limit: int
+    items: List[NewsItem]
+    stored_at: float
+
+
+class SemanticQueryCache:
+    """In-memory TTL cache that serves search results for near-duplicate queries.
+
+    Queries are embedded with a sentence-transformers model when one is installed,
+    otherwise with a bag-of-tokens vector, and a lookup returns the closest cached
+    query for the same limit if its cosine similarity clears ``threshold``.
+    """
+
+    DEFAULT_MODEL = "all-MiniLM-L6-v2"
+
+    def __init__(
+        self,
+        ttl: float = 300.0,
+        threshold: float = 0.9,
+        maxsize: int = 256,
+        embedder: Optional[Callable[[str], Vector]] = None,
+    ) -> None:
+        self._ttl = ttl
+        self._threshold = threshold
+        self._maxsize = max(1, maxsize)
+        self._embedder = embedder
+        self._model = None
+        self._entries: "OrderedDict[str, _CacheEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def embed(self, query: str) -> Vector:
+        """Embed ``query`` once so a ``get`` miss can hand the same vector to ``put``."""
+        if self._embedder is not None:
+            return self._embedder(query)
+        if SentenceTransformer is not None:
+            if self._model is None:
+                with self._lock:
+                    if self._model is None:
+                        self._model = SentenceTransformer(self.DEFAULT_MODEL)
+            return self._model.encode(query.strip(), normalize_embeddings=True).tolist()
+        return _token_vector(query)
+
+    def get(self, query: str, limit: int, vector: Optional[Vector] = None) -> Optional[List[NewsItem]]:
+        if vector is None:
+            vector = self.embed(query)
+        now = time.monotonic()
+        best_key: Optional[str] = None
+        best_score = self._threshold
+        with self._lock:
+            self._evict_expired(now)
+            for key, entry in self._entries.items():
+                if entry.limit != limit:
+                    continue
+                score = _cosine(vector, entry.vector)
+                if score >= best_score:
+                    best_key, best_score = key, score
+            if best_key is None:
+                return None
+            self._entries.move_to_end(best_key)
+            return list(self._entries[best_key].items)
+
+    def put(self, query: str, limit: int, items: List[NewsItem], vector: Optional[Vector] = None) -> None:
+        if vector is None:
+            vector = self.embed(query)
+        entry = _CacheEntry(vector, limit, list(items), time.monotonic())
+        key = f"{limit}|{_normalize_query(query)}"
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def _evict_expired(self, now: float) -> None:
+        expired = [key for key, entry in self._entries.items() if now - entry.stored_at > self._ttl]
+        for key in expired:
+            del self._entries[key]
+
+
+class ContentCache(Generic[T]):
+    """Thread-safe LRU cache keyed by a blake2b digest of article text."""
+
+    def __init__(self, maxsize: int = 4096) -> None:
+        self._entries: LRUCache = LRUCache(maxsize=maxsize)
+        self._lock = threading.Lock()
+
+    def get(self, text: Optional[str]) -> Optional[T]:
+        key = _content_key(text)
+        with self._lock:
+            return self._entries.get(key)
+
+    def put(self, text: Optional[str], value: T) -> None:
+        key = _content_key(text)
+        with self._lock:
+            self._entries[key] = value
+
+
+def _content_key(text: Optional[str]) -> bytes:
+    return hashlib.blake2b((text or "").encode(), digest_size=16).digest()
+
+
+def _query_tokens(query: str) -> List[str]:
+    return _QUERY_TOKEN_RE.findall(query.casefold())
+
+
+def _normalize_query(query: str) -> str:
+    return " ".join(_query_tokens(query))
+
+
+def _token_vector(query: str) -> Mapping[str, float]:
+    counts = Counter(_query_tokens(query))
+    norm = math.sqrt(sum(count * count for count in counts.values()))
+    if not norm:
+        return {}
+    return {token: count / norm for token, count in counts.items()}
+
+
+def _cosine(a: Vector, b: Vector) -> float:
+    # Both vector kinds are stored unit-normalized, so the dot product is the cosine.
+    if isinstance(a, Mapping) and isinstance(b, Mapping):
+        if len(a) > len(b):
+            a, b = b, a
+        return sum(weight * b.get(token, 0.0) for token, weight in a.items())
+    if isinstance(a, Mapping) or isinstance(b, Mapping) or len(a) != len(b):
+        return 0.0
+    return sum(x * y for x, y in zip(a, b))
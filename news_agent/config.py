@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import List, Optional
+from typing import FrozenSet, List, Optional, Tuple
 
 
 def _split_csv(value: Optional[str]) -> List[str]:
@@ -19,6 +19,17 @@ class AgentConfig:
     allowed_domains: List[str] = field(default_factory=list)
     max_per_source: Optional[int] = 1
     sec_user_agent: Optional[str] = None
+    sec_cache_dir: Optional[str] = None
+    cache_ttl: float = 300.0
+    semantic_cache_threshold: float = 0.9
+    nlp_workers: int = 0
+    allowed_hosts: FrozenSet[str] = field(init=False, repr=False, compare=False, default=frozenset())
+    allowed_suffixes: Tuple[str, ...] = field(init=False, repr=False, compare=False, default=())
+
+    def __post_init__(self) -> None:
+        # Lowercased once here so per-article domain checks are a set lookup plus one endswith().
+        self.allowed_hosts = frozenset(domain.lower() for domain in self.allowed_domains)
+        self.allowed_suffixes = tuple(f".{domain}" for domain in self.allowed_hosts)
 
     @classmethod
     def from_env(cls) -> "AgentConfig":
@@ -30,6 +41,10 @@ class AgentConfig:
             allowed_domains=_split_csv(os.getenv("NEWS_AGENT_ALLOWED_DOMAINS")),
             max_per_source=_parse_source_limit(os.getenv("NEWS_AGENT_MAX_PER_SOURCE"), default=1),
             sec_user_agent=os.getenv("NEWS_AGENT_SEC_USER_AGENT"),
+            sec_cache_dir=os.getenv("NEWS_AGENT_SEC_CACHE_DIR"),
+            cache_ttl=float(os.getenv("NEWS_AGENT_CACHE_TTL", "300")),
+            semantic_cache_threshold=float(os.getenv("NEWS_AGENT_SEMANTIC_CACHE_THRESHOLD", "0.9")),
+            nlp_workers=int(os.getenv("NEWS_AGENT_NLP_WORKERS", "0")),
         )
 
 
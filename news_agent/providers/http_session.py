@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+def build_session() -> requests.Session:
+    """Create a ``requests.Session`` with pooled keep-alive connections and light retries."""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=32,
+        max_retries=Retry(total=2, backoff_factor=0.2),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+# Shared by providers that do not need their own headers so TCP/TLS connections are reused.
+SESSION = build_session()
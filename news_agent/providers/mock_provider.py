@@ -4,10 +4,9 @@ from datetime import datetime, timedelta
 from typing import Iterable
 
 from ..models import RawArticle
-from .base import BaseProvider
 
 
-class MockProvider(BaseProvider):
+class MockProvider:
     """Returns hard-coded articles for offline development."""
 
     def fetch(self, query: str, limit: int = 10, **kwargs) -> Iterable[RawArticle]:
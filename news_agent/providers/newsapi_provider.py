@@ -3,13 +3,11 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Iterable, Mapping, Optional
 
-import requests
-
 from ..models import RawArticle
-from .base import BaseProvider
+from .http_session import SESSION
 
 
-class NewsAPIProvider(BaseProvider):
+class NewsAPIProvider:
     """Fetches articles from newsapi.org."""
 
     BASE_URL = "https://newsapi.org/v2/everything"
@@ -26,7 +24,7 @@ class NewsAPIProvider(BaseProvider):
             "language": kwargs.get("language", "en"),
             "sortBy": kwargs.get("sort_by", "publishedAt"),
         }
-        response = requests.get(
+        response = SESSION.get(
             self.BASE_URL,
             params=params,
             headers={"Authorization": self._api_key},
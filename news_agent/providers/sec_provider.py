@@ -3,15 +3,25 @@ from __future__ import annotations
 from datetime import datetime, timedelta
 from functools import lru_cache
 import logging
+import os
 from typing import Dict, Iterable, List, Mapping, Optional
 
 import requests
 
 from ..models import RawArticle
-from .base import BaseProvider
+from .http_session import build_session
+
+try:
+    import diskcache
+except Exception:  # pragma: no cover - dependency optional
+    diskcache = None  # type: ignore
 
 SEC_BASE = "https://data.sec.gov"
 TICKER_MAP_URL = "https://www.sec.gov/files/company_tickers.json"
+DEFAULT_CACHE_DIR = os.path.join("~", ".cache", "news_agent_sec")
+TICKER_MAP_TTL = 86400
+SUBMISSIONS_TTL = 3600
+ANNUAL_REPORT_FORMS = frozenset({"10-K", "10-K/A"})
 
 
 logger = logging.getLogger(__name__)
@@ -20,10 +30,22 @@ logger = logging.getLogger(__name__)
 class SECClient:
     """Lightweight helper to interact with the SEC EDGAR datasets."""
 
-    def __init__(self, user_agent: str) -> None:
+    def __init__(self, user_agent: str, cache_dir: Optional[str] = None) -> None:
         if not user_agent or "@" not in user_agent:
             raise ValueError("SEC user agent must include a contact email per SEC guidelines")
-        self._session = requests.Session()
+        # On-disk (sqlite-backed) cache shared across restarts and worker processes.
+        # ``None`` selects the default location; an empty string disables it.
+        if cache_dir is None:
+            cache_dir = DEFAULT_CACHE_DIR
+        self._disk = None
+        if diskcache is not None and cache_dir:
+            path = os.path.expanduser(cache_dir)
+            try:
+                self._disk = diskcache.Cache(path)
+            except Exception as exc:
+                # e.g. a read-only HOME in a container; run uncached rather than fail startup.
+                logger.warning("SEC disk cache unavailable at %s: %s", path, exc)
+        self._session = build_session()
         self._session.headers.update(
             {
                 "User-Agent": user_agent,
@@ -32,13 +54,22 @@ class SECClient:
             }
         )
 
-    def get_json(self, path: str) -> Mapping[str, object]:
-        response = self._session.get(f"{SEC_BASE}{path}", timeout=15)
+    def get_json(self, path: str, ttl: int = SUBMISSIONS_TTL) -> Mapping[str, object]:
+        url = f"{SEC_BASE}{path}"
+        cached = self._disk_get(url)
+        if cached is not None:
+            return cached
+        response = self._session.get(url, timeout=15)
         response.raise_for_status()
-        return response.json()
+        payload = response.json()
+        self._disk_set(url, payload, ttl)
+        return payload
 
     @lru_cache(maxsize=1)
     def ticker_map(self) -> Dict[str, Dict[str, str]]:
+        cached = self._disk_get(TICKER_MAP_URL)
+        if cached is not None:
+            return cached
         try:
             response = self._session.get(TICKER_MAP_URL, timeout=15)
             response.raise_for_status()
@@ -56,8 +87,27 @@ class SECClient:
                     "cik": f"{cik:010d}",
                     "title": title or ticker.upper(),
                 }
+        if mapping:
+            self._disk_set(TICKER_MAP_URL, mapping, TICKER_MAP_TTL)
         return mapping
 
+    def _disk_get(self, key: str) -> Optional[object]:
+        if self._disk is None:
+            return None
+        try:
+            return self._disk.get(key)
+        except Exception as exc:
+            logger.warning("SEC disk cache read failed for %s: %s", key, exc)
+            return None
+
+    def _disk_set(self, key: str, value: object, ttl: int) -> None:
+        if self._disk is None:
+            return
+        try:
+            self._disk.set(key, value, expire=ttl)
+        except Exception as exc:
+            logger.warning("SEC disk cache write failed for %s: %s", key, exc)
+
     def resolve_cik(self, query: str) -> Optional[Dict[str, str]]:
         normalized = query.strip().upper()
         if not normalized:
@@ -84,7 +134,7 @@ class SECClient:
         return self.get_json(f"/api/xbrl/companyfacts/CIK{cik}.json")
 
 
-class SECFilingsProvider(BaseProvider):
+class SECFilingsProvider:
     """Fetches Form 10-K filings from the SEC with basic financial highlights."""
 
     MAX_AGE_YEARS = 10
@@ -103,8 +153,13 @@ class SECFilingsProvider(BaseProvider):
         ],
     }
 
-    def __init__(self, user_agent: str, max_years: int = MAX_AGE_YEARS) -> None:
-        self._client = SECClient(user_agent)
+    def __init__(
+        self,
+        user_agent: str,
+        max_years: int = MAX_AGE_YEARS,
+        cache_dir: Optional[str] = None,
+    ) -> None:
+        self._client = SECClient(user_agent, cache_dir=cache_dir)
         self._max_years = max(1, max_years)
 
     def fetch(self, query: str, limit: int = 10, **kwargs: Mapping[str, object]) -> Iterable[RawArticle]:
@@ -117,10 +172,10 @@ class SECFilingsProvider(BaseProvider):
         filings = self._collect_filings(cik, cutoff)
         if not filings:
             return []
-        facts = self._safe_company_facts(cik)
+        facts_index = self._index_facts_by_accession(self._safe_company_facts(cik))
         items: List[RawArticle] = []
         for filing in filings[:limit]:
-            summary = self._compose_summary(filing, facts)
+            summary = self._compose_summary(filing, facts_index)
             title = f"{company_name} Form 10-K ({filing['filing_date'].year})"
             source = f"SEC 10-K FY{filing.get('fy') or filing['filing_date'].year}"
             items.append(
@@ -153,8 +208,6 @@ class SECFilingsProvider(BaseProvider):
         for dataset in datasets:
             records = self._iter_records(dataset)
             for record in records:
-                if record.get("form") not in {"10-K", "10-K/A"}:
-                    continue
                 filing_date = self._parse_date(record.get("filingDate"))
                 if filing_date is None or filing_date < cutoff:
                     continue
@@ -195,21 +248,25 @@ class SECFilingsProvider(BaseProvider):
         if "filings" in dataset and isinstance(dataset["filings"], Mapping):
             recent = dataset["filings"].get("recent")
             if isinstance(recent, Mapping):
-                return self._normalize_rows(recent)
-        return self._normalize_rows(dataset)
+                return self._annual_report_rows(recent)
+        return self._annual_report_rows(dataset)
+
+    _RECORD_FIELDS = ("form", "filingDate", "accessionNumber", "primaryDocument", "reportDate", "fy")
 
-    def _normalize_rows(self, payload: Mapping[str, object]) -> List[Dict[str, object]]:
+    def _annual_report_rows(self, payload: Mapping[str, object]) -> List[Dict[str, object]]:
+        # EDGAR ships filings column-wise; scan the form column in place and only
+        # build row dicts (with just the fields we read) for 10-K filings.
         forms = payload.get("form")
         if not isinstance(forms, list):
             return []
-        length = len(forms)
+        columns = [
+            (key, payload[key]) for key in self._RECORD_FIELDS if isinstance(payload.get(key), list)
+        ]
         rows: List[Dict[str, object]] = []
-        for idx in range(length):
-            row: Dict[str, object] = {}
-            for key, value in payload.items():
-                if isinstance(value, list) and len(value) > idx:
-                    row[key] = value[idx]
-            rows.append(row)
+        for idx, form in enumerate(forms):
+            if form not in ANNUAL_REPORT_FORMS:
+                continue
+            rows.append({key: column[idx] for key, column in columns if len(column) > idx})
         return rows
 
     def _build_filing_url(self, cik: str, accession: str, primary: Optional[str]) -> str:
@@ -234,11 +291,11 @@ class SECFilingsProvider(BaseProvider):
         except requests.HTTPError:
             return {}
 
-    def _compose_summary(self, filing: Mapping[str, object], facts: Mapping[str, object]) -> str:
+    def _compose_summary(self, filing: Mapping[str, object], facts_index: Mapping[str, Dict[str, float]]) -> str:
         accession = filing.get("accession")
         fy = filing.get("fy")
         report_date = filing.get("report_date")
-        metrics = self._extract_financials(accession, facts)
+        metrics = self._extract_financials(accession, facts_index)
         parts = [f"Form {filing.get('form')} filed on {filing['filing_date'].date()}."]
         if fy:
             parts.append(f"Fiscal year: {fy}.")
@@ -253,24 +310,36 @@ class SECFilingsProvider(BaseProvider):
             parts.append("Financial highlights unavailable from XBRL dataset.")
         return " ".join(parts)
 
-    def _extract_financials(self, accession: Optional[str], facts: Mapping[str, object]) -> Dict[str, str]:
-        if not accession or not isinstance(facts, Mapping):
+    def _extract_financials(self, accession: Optional[str], facts_index: Mapping[str, Dict[str, float]]) -> Dict[str, str]:
+        if not accession:
             return {}
-        fact_root = facts.get("facts")
-        if not isinstance(fact_root, Mapping):
-            return {}
-        us_gaap = fact_root.get("us-gaap")
-        if not isinstance(us_gaap, Mapping):
+        values = facts_index.get(accession)
+        if not values:
             return {}
         results: Dict[str, str] = {}
         for label, concepts in self._FINANCIAL_CONCEPTS.items():
-            value = self._find_fact_value(us_gaap, concepts, accession)
+            value = self._find_fact_value(values, concepts)
             if value is not None:
                 results[self._label_for(label)] = self._format_currency(value)
         return results
 
-    def _find_fact_value(self, us_gaap: Mapping[str, object], concepts: List[str], accession: str) -> Optional[float]:
-        for concept in concepts:
+    def _index_facts_by_accession(self, facts: Mapping[str, object]) -> Dict[str, Dict[str, float]]:
+        """Group 10-K fact values as ``{accession: {concept: value}}`` in a single pass.
+
+        Only concepts listed in ``_FINANCIAL_CONCEPTS`` are indexed, and the first
+        value seen for an accession/concept pair wins, matching the old linear scan.
+        """
+        if not isinstance(facts, Mapping):
+            return {}
+        fact_root = facts.get("facts")
+        if not isinstance(fact_root, Mapping):
+            return {}
+        us_gaap = fact_root.get("us-gaap")
+        if not isinstance(us_gaap, Mapping):
+            return {}
+        wanted = {concept for concepts in self._FINANCIAL_CONCEPTS.values() for concept in concepts}
+        index: Dict[str, Dict[str, float]] = {}
+        for concept in wanted:
             concept_payload = us_gaap.get(concept)
             if not isinstance(concept_payload, Mapping):
                 continue
@@ -283,10 +352,21 @@ class SECFilingsProvider(BaseProvider):
                 for entry in series:
                     if not isinstance(entry, Mapping):
                         continue
-                    if entry.get("accn") == accession and entry.get("form") in {"10-K", "10-K/A"}:
-                        val = entry.get("val")
-                        if isinstance(val, (int, float)):
-                            return float(val)
+                    accession = entry.get("accn")
+                    val = entry.get("val")
+                    if (
+                        isinstance(accession, str)
+                        and entry.get("form") in ANNUAL_REPORT_FORMS
+                        and isinstance(val, (int, float))
+                    ):
+                        index.setdefault(accession, {}).setdefault(concept, float(val))
+        return index
+
+    def _find_fact_value(self, values: Mapping[str, float], concepts: List[str]) -> Optional[float]:
+        for concept in concepts:
+            value = values.get(concept)
+            if value is not None:
+                return value
         return None
 
     def _label_for(self, key: str) -> str:
@@ -1,18 +1,44 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 import difflib
+from email.utils import parsedate_to_datetime
 import re
-from typing import Dict, Iterable, List, Mapping
+import threading
+from typing import Dict, Iterable, List, Mapping, Optional
 
 import feedparser
-import requests
 
 from ..models import RawArticle
-from .base import BaseProvider
+from .http_session import SESSION
 
+try:
+    from rapidfuzz import fuzz, process
+except Exception:  # pragma: no cover - dependency optional
+    fuzz = process = None  # type: ignore
 
-class WiredRSSProvider(BaseProvider):
+try:
+    import ahocorasick
+except Exception:  # pragma: no cover - dependency optional
+    ahocorasick = None  # type: ignore
+
+try:
+    from lxml import etree
+except Exception:  # pragma: no cover - dependency optional
+    etree = None  # type: ignore
+
+_TOKEN_SPLIT_RE = re.compile(r"[^a-z0-9]+")
+
+_ATOM_NS = "{http://www.w3.org/2005/Atom}"
+_CONTENT_ENCODED = "{http://purl.org/rss/1.0/modules/content/}encoded"
+_MARKUP_CHARS = frozenset("<>&")
+_ATOM_TEXT_TAGS = tuple(f"{_ATOM_NS}{name}" for name in ("title", "summary", "content"))
+# lxml parser objects must not be shared between threads, and sections are fetched concurrently.
+_PARSERS = threading.local()
+
+
+class WiredRSSProvider:
     """Fetches and filters articles from Wired RSS feeds."""
 
     DEFAULT_SECTIONS: Dict[str, str] = {
@@ -25,16 +51,15 @@ class WiredRSSProvider(BaseProvider):
 
     def fetch(self, query: str, limit: int = 10, **kwargs: Mapping[str, object]) -> Iterable[RawArticle]:
         results: List[RawArticle] = []
-        for section, url in self._sections.items():
-            try:
-                response = requests.get(url, timeout=10)
-                response.raise_for_status()
-            except Exception:
-                continue  # Skip failed feeds but continue others
-            feed = feedparser.parse(response.content)
-            entries = feed.entries or []
+        matcher = _QueryMatcher(query)
+        sections = list(self._sections.items())
+        if not sections:
+            return results
+        with ThreadPoolExecutor(max_workers=len(sections)) as executor:
+            feeds = list(executor.map(_fetch_entries, [url for _, url in sections]))
+        for (section, _), entries in zip(sections, feeds):
             for entry in entries:
-                if not _matches_query(query, _entry_text(entry)):
+                if not matcher.matches(_entry_text(entry)):
                     continue
                 results.append(
                     RawArticle(
@@ -51,6 +76,125 @@ class WiredRSSProvider(BaseProvider):
         return results
 
 
+def _fetch_entries(url: str) -> List[Mapping[str, object]]:
+    try:
+        response = SESSION.get(url, timeout=10)
+        response.raise_for_status()
+    except Exception:
+        return []  # Skip failed feeds but continue others
+    entries = _parse_feed_fast(response.content)
+    if entries is None:
+        feed = feedparser.parse(response.content)
+        entries = feed.entries or []
+    return entries
+
+
+def _parse_feed_fast(content: bytes) -> Optional[List[Dict[str, object]]]:
+    """Parse plain RSS 2.0 / Atom feeds with lxml into feedparser-shaped dicts.
+
+    Returns ``None`` when lxml is unavailable, the document is not well-formed XML,
+    it is not a format handled here, or any text field carries markup or entities
+    that feedparser would sanitize or re-escape; the caller then falls back to
+    feedparser.
+    """
+    if etree is None:
+        return None
+    parser = getattr(_PARSERS, "parser", None)
+    if parser is None:
+        parser = etree.XMLParser(recover=False, remove_blank_text=True, resolve_entities=False, no_network=True)
+        _PARSERS.parser = parser
+    try:
+        root = etree.fromstring(content, parser)
+    except Exception:
+        return None
+    if root is None:
+        return None
+    try:
+        if root.tag == "rss":
+            return [_rss_item(item) for item in root.iter("item")]
+        if root.tag == f"{_ATOM_NS}feed":
+            # feedparser serializes inline XHTML content; leave those feeds to it.
+            if any(node.get("type") == "xhtml" for node in root.iter(*_ATOM_TEXT_TAGS)):
+                return None
+            return [_atom_entry(entry) for entry in root.iter(f"{_ATOM_NS}entry")]
+    except _NeedsFeedparser:
+        return None
+    return None
+
+
+class _NeedsFeedparser(Exception):
+    """Raised while walking a feed whose text fields need feedparser's HTML handling."""
+
+
+def _plain_text(value: Optional[str]) -> Optional[str]:
+    # feedparser strips text fields, sanitizes markup and re-escapes "&" in HTML
+    # fields; only markup-free text is guaranteed to come out the same here.
+    if not value:
+        return None
+    value = value.strip()
+    if not _MARKUP_CHARS.isdisjoint(value):
+        raise _NeedsFeedparser
+    return value
+
+
+def _rss_item(item) -> Dict[str, object]:
+    entry: Dict[str, object] = {}
+    _set_if(entry, "title", _plain_text(item.findtext("title")))
+    _set_if(entry, "link", (item.findtext("link") or "").strip())
+    if "link" not in entry:
+        # Like feedparser, a permalink guid stands in for a missing <link>.
+        guid = item.find("guid")
+        if guid is not None and guid.get("isPermaLink", "true").lower() != "false":
+            _set_if(entry, "link", (guid.text or "").strip())
+    _set_if(entry, "summary", _plain_text(item.findtext("description")))
+    _set_content(entry, _plain_text(item.findtext(_CONTENT_ENCODED)))
+    _set_if(entry, "published_parsed", _struct_time(item.findtext("pubDate")))
+    return entry
+
+
+def _atom_entry(node) -> Dict[str, object]:
+    entry: Dict[str, object] = {}
+    _set_if(entry, "title", _plain_text(node.findtext(f"{_ATOM_NS}title")))
+    for candidate in node.iter(f"{_ATOM_NS}link"):
+        if candidate.get("rel", "alternate") == "alternate":
+            _set_if(entry, "link", (candidate.get("href") or "").strip())
+            break
+    _set_if(entry, "summary", _plain_text(node.findtext(f"{_ATOM_NS}summary")))
+    _set_content(entry, _plain_text(node.findtext(f"{_ATOM_NS}content")))
+    _set_if(entry, "published_parsed", _struct_time(node.findtext(f"{_ATOM_NS}published")))
+    _set_if(entry, "updated_parsed", _struct_time(node.findtext(f"{_ATOM_NS}updated")))
+    return entry
+
+
+def _set_if(entry: Dict[str, object], key: str, value: object) -> None:
+    # feedparser omits absent elements rather than storing None; callers rely on .get defaults.
+    if value:
+        entry[key] = value
+
+
+def _set_content(entry: Dict[str, object], value: Optional[str]) -> None:
+    if value:
+        entry["content"] = [{"value": value}]
+        # Like feedparser, an entry without a summary reports its content as one.
+        entry.setdefault("summary", value)
+
+
+def _struct_time(value: Optional[str]):
+    """Convert an RFC 822 or ISO 8601 date into a UTC ``time.struct_time`` like feedparser does."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        parsed = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        try:
+            parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+    # Naive values are taken as UTC, as feedparser does; utctimetuple also sets tm_isdst=0 like it.
+    return parsed.utctimetuple()
+
+
 def _entry_text(entry: Mapping[str, object]) -> str:
     title = str(entry.get("title", ""))
     summary = str(entry.get("summary", ""))
@@ -95,25 +239,52 @@ def _parse_published(entry: Mapping[str, object]) -> datetime | None:
     return None
 
 
-def _matches_query(query: str, entry_text: str) -> bool:
-    tokens = _tokenize(query)
-    if not tokens:
-        return True
-    entry_text = entry_text.lower()
-    entry_tokens = _tokenize(entry_text)
-    entry_token_set = set(entry_tokens)
-    for token in tokens:
-        if token in entry_text:
+class _QueryMatcher:
+    """Matches entry text against the tokens of a single query.
+
+    Built once per ``fetch`` call so multi-token queries are compiled into one
+    Aho-Corasick automaton (when ``pyahocorasick`` is installed) and each entry
+    needs a single scan for the exact-substring check.
+    """
+
+    def __init__(self, query: str) -> None:
+        self.tokens = list(dict.fromkeys(_tokenize(query)))
+        self._fuzzy_tokens = [token for token in self.tokens if len(token) >= 3]
+        self._automaton = None
+        if ahocorasick is not None and len(self.tokens) > 1:
+            automaton = ahocorasick.Automaton()
+            for token in self.tokens:
+                automaton.add_word(token, token)
+            automaton.make_automaton()
+            self._automaton = automaton
+
+    def matches(self, entry_text: str) -> bool:
+        """Check an already-lowercased entry text, as produced by ``_entry_text``."""
+        if not self.tokens:
             return True
-        if len(token) >= 3:
-            for candidate in entry_token_set:
-                if _similar(token, candidate):
-                    return True
-    return False
+        if self._contains_token(entry_text):
+            return True
+        if not self._fuzzy_tokens:
+            return False
+        entry_token_set = set(_TOKEN_SPLIT_RE.split(entry_text))
+        entry_token_set.discard("")
+        return any(_has_similar(token, entry_token_set) for token in self._fuzzy_tokens)
+
+    def _contains_token(self, entry_text: str) -> bool:
+        if self._automaton is not None:
+            return next(self._automaton.iter(entry_text), None) is not None
+        return any(token in entry_text for token in self.tokens)
 
 
 def _tokenize(value: str) -> List[str]:
-    return [token for token in re.split(r"[^a-z0-9]+", value.lower()) if token]
+    return [token for token in _TOKEN_SPLIT_RE.split(value.lower()) if token]
+
+
+def _has_similar(token: str, candidates: Iterable[str], threshold: float = 0.82) -> bool:
+    if process is not None:
+        # RapidFuzz scores on a 0-100 scale and scans all candidates in native code.
+        return process.extractOne(token, candidates, scorer=fuzz.ratio, score_cutoff=threshold * 100) is not None
+    return any(_similar(token, candidate, threshold) for candidate in candidates)
 
 
 def _similar(a: str, b: str, threshold: float = 0.82) -> bool:
@@ -1,6 +1,17 @@
 from __future__ import annotations
 
-from typing import Optional
+import re
+from typing import Dict, FrozenSet, Iterable, Optional
+
+try:
+    import ahocorasick
+except Exception:  # pragma: no cover - dependency optional
+    ahocorasick = None  # type: ignore
+
+try:
+    import re2 as keyword_re
+except Exception:  # pragma: no cover - dependency optional
+    keyword_re = re  # type: ignore
 
 _POSITIVE = {
     "growth",
@@ -39,13 +50,95 @@ _NEGATIVE = {
     "downgrade",
 }
 
+_VOWELS = frozenset("aeiou")
+
+
+def _inflections(word: str) -> FrozenSet[str]:
+    """Return ``word`` with the regular plural and verb endings the scanners accept.
+
+    A fixed suffix set keeps "risks", "improved" and "dropped" counting without
+    letting "miss" fire inside "mission" or "drop" inside "dropbox".
+    """
+    if word.endswith("e"):
+        suffixed = (word + "s", word + "d", word[:-1] + "ing")
+    elif word.endswith("y") and word[-2] not in _VOWELS:
+        suffixed = (word[:-1] + "ies", word[:-1] + "ied", word + "ing")
+    elif word.endswith(("s", "x", "z", "ch", "sh")):
+        suffixed = (word + "es", word + "ed", word + "ing")
+    elif len(word) <= 4 and word[-1] not in _VOWELS | set("wxy") and word[-2] in _VOWELS and word[-3] not in _VOWELS:
+        # Short consonant-vowel-consonant words double the final letter: drop -> dropped.
+        suffixed = (word + "s", word + word[-1] + "ed", word + word[-1] + "ing")
+    else:
+        suffixed = (word + "s", word + "ed", word + "ing")
+    return frozenset((word, *suffixed))
+
+
+# Derived once at import for the matchers below: keyword -> +1/-1, and every accepted
+# inflected form -> the polarity of its keyword.
+_POLARITY: Dict[str, int] = {**{token: 1 for token in _POSITIVE}, **{token: -1 for token in _NEGATIVE}}
+_FORM_POLARITY: Dict[str, int] = {
+    form: polarity for token, polarity in _POLARITY.items() for form in _inflections(token)
+}
+
+
+def _build_automaton():
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for form, polarity in _FORM_POLARITY.items():
+        automaton.add_word(form, (polarity > 0, len(form)))
+    automaton.make_automaton()
+    return automaton
+
+
+def _trie_pattern(words: Iterable[str]) -> str:
+    """Build an alternation factored on shared prefixes, e.g. ``improv(?:e|ing)``.
+
+    Matches the same strings as a flat longest-first alternation, but the regex
+    engine tests each shared prefix once instead of once per keyword. Where a
+    keyword is a prefix of another, the longer branch is tried first.
+    """
+    trie: Dict[str, dict] = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def emit(node: Dict[str, dict]) -> str:
+        branches = [re.escape(char) + emit(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        alternation = "|".join(branches)
+        if "" in node:
+            return f"(?:{alternation})?"
+        return alternation if len(branches) == 1 else f"(?:{alternation})"
+
+    return emit(trie)
+
+
+# Single-pass keyword scanners over both lexicons. A match must be a whole word, one of
+# the inflected forms above, so "risk" never fires inside "asterisk" or "gain" inside
+# "again", while "risks" and "improved" still count. The automaton is used when
+# pyahocorasick is installed; otherwise one compiled prefix-factored alternation, run
+# on RE2's linear-time DFA when google-re2 is available. The alternation is
+# case-insensitive so it can scan the original text without a lowercased copy.
+_AUTOMATON = _build_automaton()
+_KEYWORD_RE = keyword_re.compile(
+    r"(?i)\b(?:" + _trie_pattern(_FORM_POLARITY) + r")\b"
+)
+
 
 def score_sentiment(text: Optional[str]) -> tuple[str, float]:
     if not text:
         return "neutral", 0.0
-    lowered = text.lower()
-    pos_hits = sum(lowered.count(token) for token in _POSITIVE)
-    neg_hits = sum(lowered.count(token) for token in _NEGATIVE)
+    # Only the automaton needs a lowercased copy; the regex scan is case-insensitive.
+    if _AUTOMATON is not None:
+        text = text.lower()
+    return _label(*_count_hits(text))
+
+
+def _label(pos_hits: int, neg_hits: int) -> tuple[str, float]:
     total = pos_hits + neg_hits
     if total == 0:
         return "neutral", 0.0
@@ -55,3 +148,35 @@ def score_sentiment(text: Optional[str]) -> tuple[str, float]:
     if score < -0.2:
         return "negative", score
     return "neutral", score
+
+
+def _count_hits(text: str) -> tuple[int, int]:
+    """Count keyword hits; the automaton path requires *text* to be lowercased."""
+    pos_hits = neg_hits = 0
+    if _AUTOMATON is None:
+        for match in _KEYWORD_RE.finditer(text):
+            # Only the matched token is lowered. Case-folding oddities such as a dotted
+            # capital I can match the pattern yet lower to no keyword; skip those.
+            polarity = _FORM_POLARITY.get(match.group().lower())
+            if polarity is None:
+                continue
+            if polarity > 0:
+                pos_hits += 1
+            else:
+                neg_hits += 1
+        return pos_hits, neg_hits
+    for end, (is_positive, length) in _AUTOMATON.iter(text):
+        start = end - length + 1
+        if start and _is_word_char(text[start - 1]):
+            continue
+        if end + 1 < len(text) and _is_word_char(text[end + 1]):
+            continue
+        if is_positive:
+            pos_hits += 1
+        else:
+            neg_hits += 1
+    return pos_hits, neg_hits
+
+
+def _is_word_char(char: str) -> bool:
+    return char.isalnum() or char == "_"
@@ -2,9 +2,12 @@ from __future__ import annotations
 
 import re
 from collections import Counter
-from typing import Iterable, List, Optional
+import heapq
+from itertools import chain
+from typing import List, Optional
 
 _WORD_RE = re.compile(r"[A-Za-z']+")
+_SENTENCE_BREAK_RE = re.compile(r"(?<=[.!?])\s+")
 
 
 def summarize(text: Optional[str], max_sentences: int = 2) -> Optional[str]:
@@ -15,28 +18,40 @@ def summarize(text: Optional[str], max_sentences: int = 2) -> Optional[str]:
         return None
     if len(sentences) <= max_sentences:
         return " ".join(sentences)
-    scores = _score_sentences(sentences)
-    ranked = sorted(enumerate(sentences), key=lambda item: scores.get(item[0], 0.0), reverse=True)
-    top_indices = sorted(idx for idx, _ in ranked[:max_sentences])
+    scores = _score_sentences(_tokenize_sentences(text, sentences))
+    top = heapq.nlargest(max_sentences, range(len(sentences)), key=lambda idx: scores.get(idx, 0.0))
+    top_indices = sorted(top)
     return " ".join(sentences[idx] for idx in top_indices)
 
 
 def _split_sentences(text: str) -> List[str]:
-    split = re.split(r"(?<=[.!?])\s+", text.strip())
-    return [sentence.strip() for sentence in split if sentence.strip()]
+    text = text.strip()
+    if not text:
+        return []
+    # The split consumes the whole whitespace run after the punctuation, so pieces are
+    # already trimmed and non-empty; no per-sentence strip/filter pass is needed.
+    return _SENTENCE_BREAK_RE.split(text)
+
+
+def _tokenize_sentences(text: str, sentences: List[str]) -> List[List[str]]:
+    # For ASCII text lower() cannot change which characters match [A-Za-z'], so each
+    # sentence is lowercased whole. Other text is lowercased word by word, since lower()
+    # may map non-ASCII letters onto [A-Za-z].
+    if text.isascii():
+        return [_WORD_RE.findall(sentence.lower()) for sentence in sentences]
+    return [[word.lower() for word in _WORD_RE.findall(sentence)] for sentence in sentences]
 
 
-def _score_sentences(sentences: Iterable[str]) -> dict[int, float]:
-    words = [word.lower() for sentence in sentences for word in _WORD_RE.findall(sentence)]
-    if not words:
+def _score_sentences(tokenized: List[List[str]]) -> dict[int, float]:
+    # Each sentence is tokenized once; both the frequency table and the scoring loop reuse it.
+    freq = Counter(chain.from_iterable(tokenized))
+    if not freq:
         return {}
-    freq = Counter(words)
     max_freq = max(freq.values())
-    normalized = {word: count / max_freq for word, count in freq.items()}
     scores: dict[int, float] = {}
-    for idx, sentence in enumerate(sentences):
-        tokens = _WORD_RE.findall(sentence)
+    for idx, tokens in enumerate(tokenized):
         if not tokens:
             continue
-        scores[idx] = sum(normalized.get(word.lower(), 0.0) for word in tokens) / len(tokens)
+        # Every token is in ``freq``, so normalize once per sentence instead of once per word.
+        scores[idx] = sum(map(freq.__getitem__, tokens)) / (max_freq * len(tokens))
     return scores
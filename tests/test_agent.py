@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+import os
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+
+from news_agent import AgentConfig, NewsAgent
+from news_agent.providers.mock_provider import MockProvider
+
+
+def test_close_shuts_down_nlp_pool():
+    agent = NewsAgent(AgentConfig(cache_ttl=0, nlp_workers=1), providers=[MockProvider()])
+    assert len(agent.search("Acme", limit=2)) == 2
+    pool = agent._nlp_pool
+    agent.close()
+    agent.close()
+    assert agent._nlp_pool is None
+    with pytest.raises(RuntimeError):
+        pool.submit(int)
+    # Analysis falls back to running in-process once the pool is gone.
+    assert len(agent.search("Globex", limit=2)) == 2
+
+
+def test_broken_nlp_pool_falls_back_and_recovers():
+    agent = NewsAgent(AgentConfig(cache_ttl=0, nlp_workers=1), providers=[MockProvider()])
+    try:
+        broken = agent._nlp_pool
+        # Kill the only worker, as the OOM killer or a SIGKILL would.
+        with pytest.raises(BrokenProcessPool):
+            broken.submit(os._exit, 1).result()
+        assert len(agent.search("Initech", limit=2)) == 2
+        assert agent._nlp_pool is not None and agent._nlp_pool is not broken
+        assert len(agent.search("Hooli", limit=2)) == 2
+    finally:
+        agent.close()
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import orjson
+import pytest
+
+import app as app_module
+from news_agent import AgentConfig, NewsAgent
+from news_agent.providers.mock_provider import MockProvider
+
+NDJSON = {"Accept": "application/x-ndjson"}
+
+
+class _FailingProvider:
+    def fetch(self, query, limit=10, **kwargs):
+        raise RuntimeError("provider exploded")
+
+
+class _FixedProvider:
+    def __init__(self, articles):
+        self._articles = articles
+
+    def fetch(self, query, limit=10, **kwargs):
+        return self._articles[:limit]
+
+
+@pytest.fixture
+def client(monkeypatch):
+    def use(*providers, agent=None):
+        agent = agent or NewsAgent(AgentConfig(cache_ttl=0, max_per_source=None), providers=list(providers))
+        monkeypatch.setattr(app_module, "_agent", agent)
+        monkeypatch.setattr(app_module, "_response_cache", None)
+        return app_module.app.test_client()
+
+    return use
+
+
+def _lines(response):
+    return [orjson.loads(line) for line in response.data.splitlines()]
+
+
+def test_ndjson_streams_one_article_per_line(client):
+    response = client(MockProvider()).post("/news", json={"query": "Acme", "limit": 2}, headers=NDJSON)
+    assert response.status_code == 200
+    assert response.mimetype == "application/x-ndjson"
+    assert [line["url"] for line in _lines(response)] == [
+        "https://example.com/sustainability",
+        "https://example.com/earnings",
+    ]
+
+
+def test_ndjson_accepts_string_limit(client):
+    response = client(MockProvider()).post("/news", json={"query": "Acme", "limit": "1"}, headers=NDJSON)
+    assert response.status_code == 200
+    assert len(_lines(response)) == 1
+
+
+@pytest.mark.parametrize("limit", ["three", -1, 1.5, True])
+def test_invalid_limit_is_rejected_before_streaming(client, limit):
+    test_client = client(MockProvider())
+    for headers in (NDJSON, {}):
+        response = test_client.post("/news", json={"query": "Acme", "limit": limit}, headers=headers)
+        assert response.status_code == 400
+        assert "Limit" in response.get_json()["error"]
+
+
+def test_ndjson_early_failure_is_a_server_error(client):
+    response = client(_FailingProvider()).post("/news", json={"query": "Acme"}, headers=NDJSON)
+    assert response.status_code == 500
+
+
+def test_ndjson_late_failure_ends_with_error_line(client, monkeypatch):
+    agent = NewsAgent(AgentConfig(cache_ttl=0, max_per_source=None), providers=[MockProvider()])
+    to_dict = agent.to_dict
+    calls = []
+
+    def fail_after_first(item):
+        calls.append(item)
+        if len(calls) > 1:
+            raise RuntimeError("serialization exploded")
+        return to_dict(item)
+
+    monkeypatch.setattr(agent, "to_dict", fail_after_first)
+    response = client(agent=agent).post("/news", json={"query": "Acme"}, headers=NDJSON)
+    assert response.status_code == 200
+    lines = _lines(response)
+    assert lines[0]["url"] == "https://example.com/sustainability"
+    assert lines[-1] == {"error": "Unexpected server error"}
+
+
+def test_json_body_matches_jsonify_framing(client):
+    articles = MockProvider().fetch("Acme", 2)
+    test_client = client(_FixedProvider(articles))
+    response = test_client.post("/news", json={"query": "Acme", "limit": 2})
+    assert response.status_code == 200
+    with app_module.app.app_context():
+        expected = app_module.jsonify([app_module._agent.to_dict(item) for item in app_module._agent.search("Acme", 2)])
+    assert response.data == expected.get_data()
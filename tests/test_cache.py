@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import pytest
+
+from news_agent import cache as cache_module
+from news_agent.cache import SemanticQueryCache
+from news_agent.models import NewsItem
+
+
+def _item(title: str) -> NewsItem:
+    return NewsItem(
+        title=title,
+        url=f"https://example.com/{title}",
+        source="example",
+        published_at=None,
+        summary=None,
+        sentiment="neutral",
+        sentiment_score=0.0,
+    )
+
+
+@pytest.fixture
+def token_cache(monkeypatch):
+    # Force the bag-of-words fallback even when sentence-transformers is installed.
+    monkeypatch.setattr(cache_module, "SentenceTransformer", None)
+    return SemanticQueryCache(ttl=300.0, threshold=0.9)
+
+
+@pytest.mark.parametrize(
+    "cached_query, other_query",
+    [
+        ("C++ jobs", "C# jobs"),
+        ("Новости рынка", "北京 新闻"),
+        ("北京 新闻", "東京 ニュース"),
+    ],
+)
+def test_distinct_queries_do_not_collide(token_cache, cached_query, other_query):
+    token_cache.put(cached_query, 5, [_item("cached")])
+    assert token_cache.get(other_query, 5) is None
+    assert [item.title for item in token_cache.get(cached_query, 5)] == ["cached"]
+
+
+def test_near_duplicate_query_is_served(token_cache):
+    token_cache.put("Apple earnings", 5, [_item("cached")])
+    assert [item.title for item in token_cache.get("  apple EARNINGS ", 5)] == ["cached"]
+    assert token_cache.get("Apple earnings", 10) is None
+
+
+def test_model_embeds_raw_query(monkeypatch):
+    seen = []
+
+    class FakeModel:
+        def __init__(self, name):
+            pass
+
+        def encode(self, text, normalize_embeddings=True):
+            seen.append(text)
+            return _FakeVector([1.0, 0.0])
+
+    class _FakeVector(list):
+        def tolist(self):
+            return list(self)
+
+    monkeypatch.setattr(cache_module, "SentenceTransformer", FakeModel)
+    SemanticQueryCache().embed("  Новости C++ ")
+    assert seen == ["Новости C++"]
@@ -0,0 +1,19 @@
+from __future__ import annotations
+
+from news_agent.providers import sec_provider
+
+
+class _FailingCache:
+    def __init__(self, directory):
+        raise PermissionError(13, "Permission denied", directory)
+
+
+class _FakeDiskcache:
+    Cache = _FailingCache
+
+
+def test_unwritable_cache_dir_disables_disk_cache(monkeypatch):
+    monkeypatch.setattr(sec_provider, "diskcache", _FakeDiskcache)
+    client = sec_provider.SECClient("News Agent ops@example.com", cache_dir="/read-only/cache")
+    assert client._disk is None
+    assert client._disk_get("https://data.sec.gov/x") is None
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import pytest
+
+from news_agent import sentiment
+
+
+@pytest.fixture(params=["automaton", "regex"])
+def scanner(request, monkeypatch):
+    if request.param == "automaton":
+        if sentiment._AUTOMATON is None:
+            pytest.skip("pyahocorasick not installed")
+    else:
+        monkeypatch.setattr(sentiment, "_AUTOMATON", None)
+    return sentiment.score_sentiment
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("Risks mount", "negative"),
+        ("Heavy LOSSES reported", "negative"),
+        ("Shares dropped sharply", "negative"),
+        ("The company missed estimates", "negative"),
+        ("Margins improved", "positive"),
+        ("Gains across the board", "positive"),
+        ("Record quarter, strong growth.", "positive"),
+        ("Revenue (increased) again", "positive"),
+    ],
+)
+def test_keyword_inflections_count(scanner, text, expected):
+    assert scanner(text)[0] == expected
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "The mission launched a missile",
+        "Dropbox hired the Beatles",
+        "An asterisk appeared again",
+        "Improvised riskless strongholds",
+        "x_risk gain_",
+    ],
+)
+def test_keyword_fragments_do_not_count(scanner, text):
+    assert scanner(text) == ("neutral", 0.0)
+
+
+def test_scanners_agree(monkeypatch):
+    if sentiment._AUTOMATON is None:
+        pytest.skip("pyahocorasick not installed")
+    texts = [
+        "Risks and losses; GROWTH! Dropbox's mission beat the drop.",
+        "Improving margins, improvised plans, penalties and a downgrade.",
+    ]
+    automaton_scores = [sentiment.score_sentiment(text) for text in texts]
+    monkeypatch.setattr(sentiment, "_AUTOMATON", None)
+    assert [sentiment.score_sentiment(text) for text in texts] == automaton_scores
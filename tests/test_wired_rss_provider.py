@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import feedparser
+import pytest
+
+from news_agent.providers import wired_rss_provider as wired
+
+pytest.importorskip("lxml")
+
+
+def _rss(items: str) -> bytes:
+    return (
+        '<?xml version="1.0"?>'
+        '<rss version="2.0" xmlns:content="http://purl.org/rss/1.0/modules/content/">'
+        f"<channel><title>Sample</title>{items}</channel></rss>"
+    ).encode()
+
+
+RSS_SAMPLE = _rss(
+    """
+    <item>
+      <title> Chip stocks rally </title>
+      <link>https://example.com/a</link>
+      <description>Nvidia rose.</description>
+      <pubDate>Tue, 10 Jun 2025 14:30:00 +0200</pubDate>
+    </item>
+    <item>
+      <link> https://example.com/b </link>
+      <content:encoded>Only an encoded body.</content:encoded>
+    </item>
+    <item>
+      <title>Plain</title>
+      <description>Just text</description>
+      <content:encoded>Body</content:encoded>
+    </item>
+    <item>
+      <title>Permalink only</title>
+      <guid isPermaLink="true">https://example.com/guid</guid>
+    </item>
+    <item>
+      <title>Implicit permalink</title>
+      <guid>https://example.com/implicit</guid>
+    </item>
+    <item>
+      <title>Opaque guid</title>
+      <guid isPermaLink="false">abc-123</guid>
+    </item>
+    """
+)
+
+ATOM_SAMPLE = b"""<?xml version="1.0"?>
+<feed xmlns="http://www.w3.org/2005/Atom">
+  <title>Sample</title>
+  <entry>
+    <title>Atom one</title>
+    <link rel="alternate" href="https://example.com/x"/>
+    <summary>Short</summary>
+    <content type="text">Long</content>
+    <published>2025-06-10T12:00:00Z</published>
+    <updated>2025-06-11T12:00:00+02:00</updated>
+  </entry>
+  <entry>
+    <title>Atom two</title>
+    <link href="https://example.com/y"/>
+    <content>Body only</content>
+  </entry>
+</feed>
+"""
+
+XHTML_SAMPLE = b"""<?xml version="1.0"?>
+<feed xmlns="http://www.w3.org/2005/Atom">
+  <entry>
+    <title>Rich</title>
+    <content type="xhtml"><div xmlns="http://www.w3.org/1999/xhtml"><p>Rich <b>body</b></p></div></content>
+  </entry>
+</feed>
+"""
+
+# Undefined HTML entities and bare ampersands make the document ill-formed XML.
+BROKEN_SAMPLE = _rss(
+    "<item><title>Caf&eacute; AT&T news&nbsp;today</title>"
+    "<link>https://e.com/a?x=1&y=2</link>"
+    "<description>Q&A session</description></item>"
+)
+
+MARKUP_SAMPLE = _rss(
+    "<item><title>AT&amp;T wins</title><link>https://e.com/m</link>"
+    '<description>&lt;p onclick="steal()"&gt;Hi&lt;/p&gt;&lt;script&gt;alert(1)&lt;/script&gt;</description></item>'
+)
+
+
+def _provider_view(entry):
+    """The fields WiredRSSProvider reads from an entry."""
+    return (
+        wired._entry_text(entry),
+        entry.get("title"),
+        entry.get("link"),
+        entry.get("summary"),
+        wired._get_content(entry),
+        wired._parse_published(entry),
+    )
+
+
+def _parsed_entries(document: bytes):
+    """Entries as _fetch_entries would produce them: fast path first, feedparser otherwise."""
+    entries = wired._parse_feed_fast(document)
+    if entries is None:
+        entries = feedparser.parse(document).entries
+    return entries
+
+
+@pytest.mark.parametrize("document", [RSS_SAMPLE, ATOM_SAMPLE], ids=["rss", "atom"])
+def test_fast_parser_matches_feedparser(document):
+    fast = wired._parse_feed_fast(document)
+    assert fast is not None
+    expected = feedparser.parse(document).entries
+    assert [_provider_view(entry) for entry in fast] == [_provider_view(entry) for entry in expected]
+
+
+def test_missing_fields_are_omitted():
+    entry = wired._parse_feed_fast(RSS_SAMPLE)[1]
+    assert "title" not in entry
+    assert "none" not in wired._entry_text(entry)
+
+
+def test_permalink_guid_fills_missing_link():
+    links = [entry.get("link") for entry in wired._parse_feed_fast(RSS_SAMPLE)[3:]]
+    assert links == ["https://example.com/guid", "https://example.com/implicit", None]
+
+
+@pytest.mark.parametrize(
+    "document", [XHTML_SAMPLE, BROKEN_SAMPLE, MARKUP_SAMPLE], ids=["xhtml", "broken", "markup"]
+)
+def test_unsupported_feeds_fall_back_to_feedparser(document):
+    assert wired._parse_feed_fast(document) is None
+    expected = feedparser.parse(document).entries
+    assert [_provider_view(entry) for entry in _parsed_entries(document)] == [
+        _provider_view(entry) for entry in expected
+    ]
+
+
+def test_broken_feed_keeps_entities_and_query_strings():
+    (entry,) = _parsed_entries(BROKEN_SAMPLE)
+    assert entry["title"].startswith("Café AT&T")
+    assert entry["link"] == "https://e.com/a?x=1&y=2"
+    assert "Q&" in entry["summary"]
+
+
+def test_markup_is_sanitized():
+    (entry,) = _parsed_entries(MARKUP_SAMPLE)
+    assert "<script" not in entry["summary"]
+    assert "onclick" not in entry["summary"]